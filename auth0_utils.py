@@ -1,10 +1,116 @@
 from fastapi import FastAPI, HTTPException, status, Body, Depends, Security
 from fastapi.security import SecurityScopes, HTTPAuthorizationCredentials, HTTPBearer
 import jwt
-from typing import Optional
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from functools import cache, lru_cache, partial
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Mapping, Optional
 from dotenv import dotenv_values
 
+logger = logging.getLogger(__name__)
+
 ###-------------------------------------------------------------------------------------------
+@cache
+def load_env_config() -> Mapping[str, Optional[str]]:
+    # Parse .env once per process; real environment variables take precedence, as with load_dotenv
+    return MappingProxyType({**dotenv_values(".env"), **os.environ})
+
+
+_JWKS_CACHE_DIR = os.path.join(tempfile.gettempdir(), f"jwks-cache-{os.getuid()}")
+
+
+class CachingJWKClient(jwt.PyJWKClient):
+    # PyJWKClient that also keeps the fetched JWKS on disk, so all worker processes on the
+    # host share one copy and a freshly started worker does not have to fetch it from Auth0
+    def __init__(self, uri: str, cache_dir: str = _JWKS_CACHE_DIR, lifespan: int = 300, **kwargs):
+        super().__init__(uri, lifespan=lifespan, **kwargs)
+        self._disk_lifespan = lifespan
+        self._cache_dir = cache_dir
+        self._cache_path = os.path.join(cache_dir, hashlib.sha256(uri.encode()).hexdigest() + ".json")
+        self._invalidated_at = 0.0
+
+    def get_jwk_set(self, refresh: bool = False) -> jwt.PyJWKSet:
+        # On an in-memory miss try the disk copy first; a refresh (unknown kid) always goes to Auth0.
+        # The disk copy is not put into memory: that would restart its lifespan, and the file's age
+        # is re-checked on every miss instead
+        if not refresh and (self.jwk_set_cache is None or self.jwk_set_cache.get() is None):
+            data = self._read_disk_cache()
+            if data is not None:
+                return jwt.PyJWKSet.from_dict(data)
+        return super().get_jwk_set(refresh)
+
+    def fetch_data(self):
+        data = super().fetch_data()
+        self._write_disk_cache(data)
+        return data
+
+    def invalidate(self) -> None:
+        """Drop every cached copy of the key set, e.g. after Auth0 rotated its signing keys."""
+        # At most once a minute, so a stream of forged tokens cannot force constant refetches
+        now = time.time()
+        if now - self._invalidated_at < 60:
+            return
+        self._invalidated_at = now
+        if self.jwk_set_cache is not None:
+            self.jwk_set_cache.put(None)
+        if hasattr(self.get_signing_key, "cache_clear"):
+            self.get_signing_key.cache_clear()
+        try:
+            os.remove(self._cache_path)
+        except OSError:
+            pass
+
+    def _cache_dir_is_private(self) -> bool:
+        # A key set planted by another user would let them mint accepted tokens
+        try:
+            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            st = os.stat(self._cache_dir)
+        except OSError:
+            return False
+        return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def _read_disk_cache(self) -> Optional[dict]:
+        if not self._cache_dir_is_private():
+            return None
+        try:
+            if time.time() - os.path.getmtime(self._cache_path) >= self._disk_lifespan:
+                return None
+            with open(self._cache_path, "rb") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_disk_cache(self, data) -> None:
+        if not isinstance(data, dict) or not self._cache_dir_is_private():
+            return
+        try:
+            # Write to a temp file and rename, so readers never see a partial key set
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as fh:
+                    json.dump(data, fh)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as error:
+            logger.debug("could not write JWKS cache %s", self._cache_path, exc_info=error)
+
+
+@lru_cache(maxsize=8)
+def _get_jwks_client(jwks_url: str) -> CachingJWKClient:
+    # One client per JWKS URL for the whole process; keys are cached and the key set is refreshed hourly
+    return CachingJWKClient(jwks_url, cache_keys=True, lifespan=3600, max_cached_keys=16)
+
+
 class UnauthorizedException(HTTPException):
     def __init__(self, detail: str):
         """Returns HTTP 403"""
@@ -22,7 +128,7 @@ class VerifyToken:
     # Does all the token verification using PyJWT
     def __init__(self):
         try:
-            config = dotenv_values(".env")
+            config = load_env_config()
             self.auth0_domain = config["AUTH0_DOMAIN"]
             self.auth0_algorithms = config["AUTH0_ALGORITHMS"]
             self.auth0_api_audience = config["AUTH0_API_AUDIENCE"]
@@ -33,32 +139,61 @@ class VerifyToken:
 
         # This gets the JWKS from a given URL and does processing, so you can use any of the keys available
         jwks_url = f'{self.auth0_domain}.well-known/jwks.json'
-        self.jwks_client = jwt.PyJWKClient(jwks_url)
+        self.jwks_client = _get_jwks_client(jwks_url)
+
+        # Fixed jwt.decode arguments, bound once; ALGORITHMS may be a comma-separated string
+        if isinstance(self.auth0_algorithms, str):
+            self._algorithms = tuple(a.strip() for a in self.auth0_algorithms.split(","))
+        else:
+            self._algorithms = tuple(self.auth0_algorithms)
+        self._decode = partial(jwt.decode,
+                               algorithms=self._algorithms,
+                               audience=self.auth0_api_audience,
+                               issuer=self.auth0_issuer,
+                               options={"require": ["exp", "iat"], "verify_signature": True},
+                               )
+
+        # Verified payloads keyed by raw token, evicted at the token's own `exp`
+        self._payload_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._cache_max = 1024
 
     async def verify(self, security_scopes: SecurityScopes,
                      token: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer())):
         if token is None:
             raise UnauthenticatedException
 
+        # Reuse the payload of a token we already verified, unless it is about to expire
+        entry = self._payload_cache.get(token.credentials)
+        if entry is not None and entry[0] > time.time() + 5:
+            self._payload_cache.move_to_end(token.credentials)
+            return entry[1]
+
         # This gets the 'kid' from the passed token
         try:
             signing_key = self.jwks_client.get_signing_key_from_jwt(token.credentials).key
         except jwt.exceptions.PyJWKClientError as error:
-            print(1)
+            logger.debug("JWKS signing key lookup failed", exc_info=error)
+            self._payload_cache.pop(token.credentials, None)
             raise UnauthorizedException(str(error))
         except jwt.exceptions.DecodeError as error:
-            print(2)
+            logger.debug("Malformed token header", exc_info=error)
+            self._payload_cache.pop(token.credentials, None)
             raise UnauthorizedException(str(error))
 
         try:
-            payload = jwt.decode(token.credentials, signing_key,
-                                 algorithms=self.auth0_algorithms,
-                                 audience=self.auth0_api_audience,
-                                 issuer=self.auth0_issuer,
-                                 )
+            payload = self._decode(token.credentials, signing_key)
         except Exception as error:
-            print(3)
+            logger.debug("Token verification failed", exc_info=error)
+            self._payload_cache.pop(token.credentials, None)
+            if isinstance(error, jwt.exceptions.InvalidSignatureError):
+                # The cached key may be stale after a rotation; fetch a fresh set next time
+                self.jwks_client.invalidate()
             raise UnauthorizedException(str(error))
 
+        # `exp` is a required claim, so every verified payload can be cached until it expires
+        self._payload_cache[token.credentials] = (payload["exp"], payload)
+        while len(self._payload_cache) > self._cache_max:
+            self._payload_cache.popitem(last=False)
+
         return payload
 
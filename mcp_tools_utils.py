@@ -1,11 +1,16 @@
-import json, ast
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from typing import Any, Dict, List, Optional
 # ---------------------------------------------------------------------------
 # Pydantic schemas for MCP
 # ---------------------------------------------------------------------------
+# Tool arguments are read-only once validated and must not carry unknown keys
+_ARGS_CONFIG = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
 class RunArgs(BaseModel):
     """Arguments expected from the MCP client."""
+    model_config = _ARGS_CONFIG
+
     folder: str = Field(
         ...,
         description="Name of the sub‑directory under DATA_ROOT that contains the experiment. The name of the sub‑directory is the capitalized form of the crop. For example apple is Apple, APPLE is Apple",
@@ -26,6 +31,8 @@ class RunResult(BaseModel):
 
 class DownloadS3Args(BaseModel):
     """Arguments expected from the MCP client."""
+    model_config = _ARGS_CONFIG
+
     folder: str = Field(
         ...,
         description="Name of the sub‑directory under DATA_ROOT that contains the experiment. The name of the sub‑directory is the capitalized form of the crop. For example apple is Apple, APPLE is Apple",
@@ -48,11 +55,15 @@ class DownloadS3Args(BaseModel):
             return v
         if isinstance(v, str):
             try:
-                x = json.loads(v)
-            except json.JSONDecodeError:
-                x = ast.literal_eval(v)
+                x = orjson.loads(v)
+            except orjson.JSONDecodeError:
+                # Python-style lists, e.g. "['SOIL.SOL', 'UFGA8201.WTH']"
+                try:
+                    x = orjson.loads(v.replace("'", '"'))
+                except orjson.JSONDecodeError:
+                    x = None
             if isinstance(x, list):
-                return [str(i) for i in x]
+                return [i if isinstance(i, str) else str(i) for i in x]
         raise TypeError("files_names_list must be a list of strings")
 
 class DownloadS3ArgsResult(BaseModel):
@@ -62,6 +73,8 @@ class DownloadS3ArgsResult(BaseModel):
 
 class UploadCollectOutputArgs(BaseModel):
     """Arguments expected from the MCP client."""
+    model_config = _ARGS_CONFIG
+
     folder: str = Field(
         ...,
         description="Name of the sub‑directory under DATA_ROOT that contains the experiment. The name of the sub‑directory is the capitalized form of the crop. For example apple is Apple, APPLE is Apple",
@@ -73,6 +86,11 @@ class UploadCollectOutputArgsResult(BaseModel):
     exit_code: int
     s3_presigned_url: str
 
+# Validators for inbound tool arguments, built once at import
+RUN_INPUT_ADAPTER = TypeAdapter(RunArgs)
+S3_INPUT_ADAPTER = TypeAdapter(DownloadS3Args)
+UPL_COL_INPUT_ADAPTER = TypeAdapter(UploadCollectOutputArgs)
+
 # JSON Schema used in /tools/list
 RUN_INPUT_SCHEMA = RunArgs.model_json_schema()
 RUN_OUTPUT_SCHEMA = RunResult.model_json_schema()
@@ -47,16 +47,20 @@ Security / guardrails
 * Checks that `experiment_file` exists inside the chosen folder.
 """
 
-import os, json, subprocess, io, zipfile, shutil
+import os, asyncio, zipfile, shutil, threading, functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import uvicorn
-from fastapi import FastAPI, HTTPException, status
+import orjson
+from fastapi import FastAPI, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from fastapi_mcp import FastApiMCP
+from pydantic import TypeAdapter, ValidationError
 from auth0_utils import *
 from mcp_tools_utils import *
-from dotenv import dotenv_values
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from botocore.exceptions import (
     NoCredentialsError,
@@ -67,7 +71,7 @@ from botocore.exceptions import (
 
 # Load .env variables
 try:
-    config = dotenv_values(".env")
+    config = load_env_config()
     ACCESS_KEY = config["ACCESS_KEY"]
     SECRET_KEY = config["SECRET_KEY"]
     S3_BUCKET = config["S3_BUCKET"]
@@ -85,10 +89,13 @@ except Exception as e:
 DSSAT_EXE = Path("/home/christos/dssat-csm-os/build/bin/dscsm048")  # ← change as needed
 DATA_ROOT = Path("/home/christos/dssat-csm-os/build/bin")           # ← change as needed
 
+_DSSAT_EXE_STR = os.fspath(DSSAT_EXE)
+_OUTPUT_TAIL_BYTES = 10000    # how much of the DSSAT stdout/stderr is returned
+
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # # Enable CORS (Cross-Origin Resource Sharing) to allow requests from any domain.
 # app.add_middleware(
@@ -101,47 +108,39 @@ app = FastAPI()
 
 auth = VerifyToken()
 
+# The tools spec is static, so serialize it once instead of on every /tools/list call
+_TOOLS_SPEC_JSON = orjson.dumps(TOOLS_SPEC)
+
 @app.get("/tools/list", operation_id="list_tools")
 def list_tools(token: str = Security(auth.verify)) -> List[Dict[str, Any]]:
     """Endpoint required by the MCP spec for tool discovery."""
-    return TOOLS_SPEC
+    return Response(content=_TOOLS_SPEC_JSON, media_type="application/json")
 
 
 @app.post("/tools/call/upload_and_collect_output_files", operation_id="upload_and_collect_output_files")
-def upload_and_collect_output_files(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
+async def upload_and_collect_output_files(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
 
     # Validate the payload against the RunArgs schema
     if "folder" in payload:
-        args = UploadCollectOutputArgs(**payload)                     # plain
+        args = _validate_args(UPL_COL_INPUT_ADAPTER, payload)             # plain
     elif "args" in payload:
-        args = UploadCollectOutputArgs(**payload["args"])             # wrapped
+        args = _validate_args(UPL_COL_INPUT_ADAPTER, payload["args"])     # wrapped
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Expected keys: folder"
         )
 
-    # Check if directory exists and create it if not
-    work_dir = (DATA_ROOT / args.folder).resolve()
+    # Resolve the folder under DATA_ROOT (no path traversal)
+    work_dir = _resolve_work_dir(args.folder)
 
-    # Change to the target directory
-    try:
-        os.chdir(work_dir)
-        print(f"Changed directory to {work_dir}")
-    except FileNotFoundError:
+    # The folder must already hold the experiment outputs
+    if not work_dir.is_dir():
         raise HTTPException(status_code=404, detail=f"{work_dir} not found")
-    except OSError as exc:
-        print(f"Error changing directory to {work_dir}: {exc}")
-        raise HTTPException(status_code=500, detail=str(exc))
 
     # Create an S3 client
     try:
-        s3 = boto3.client("s3",
-                        aws_access_key_id=ACCESS_KEY,
-                        aws_secret_access_key=SECRET_KEY,
-                        region_name=S3_REGION,
-                        endpoint_url=f"https://s3.{S3_REGION}.amazonaws.com",
-                        config=Config(signature_version='s3v4'))
+        s3 = _s3_client(f"https://s3.{S3_REGION}.amazonaws.com")
     except NoCredentialsError as e:
         raise RuntimeError("AWS credentials are missing or invalid.") from e
     except EndpointConnectionError as e:
@@ -153,23 +152,8 @@ def upload_and_collect_output_files(payload: Dict[str, Any], token: str = Securi
     key = f"{args.folder}.zip"
 
     try:
-        # Build ZIP in memory and upload
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            for root, _dirs, files in os.walk(work_dir):
-                for name in files:
-                    full = Path(root) / name
-                    arcname = str(full.relative_to(work_dir))
-                    zf.write(full, arcname=arcname)
-        buf.seek(0)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create ZIP file: {e}"
-        )
-    try:
-        # Upload the ZIP to S3
-        s3.upload_fileobj(buf, S3_BUCKET, key)
+        # Build the ZIP and upload it to S3 at the same time, off the event loop
+        zip_error = await asyncio.to_thread(_stream_zip_to_s3, s3, work_dir, key)
     except ClientError as e:
         code = e.response.get("Error", {}).get("Code", "Unknown")
         msg = e.response.get("Error", {}).get("Message", str(e))
@@ -181,10 +165,15 @@ def upload_and_collect_output_files(payload: Dict[str, Any], token: str = Securi
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload ZIP to S3: {e}"
-        )   
+        )
+    if zip_error is not None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create ZIP file: {zip_error}"
+        )
 
     try:
-        shutil.rmtree(work_dir, ignore_errors=True)
+        await asyncio.to_thread(shutil.rmtree, work_dir, ignore_errors=True)
     except OSError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,40 +198,30 @@ def upload_and_collect_output_files(payload: Dict[str, Any], token: str = Securi
             detail=f"Failed to generate presigned URL: {e}"
         )
     
-    # Create the result object
-    try:
-        result = UploadCollectOutputArgsResult(
-            exit_code=status.HTTP_200_OK,
-            s3_presigned_url=url,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create result object: {e}"
-        )
+    # Create the result object (server-built values, no validation needed)
+    result = UploadCollectOutputArgsResult.model_construct(
+        exit_code=status.HTTP_200_OK,
+        s3_presigned_url=url,
+    )
 
-    return json.loads(result.model_dump_json())
+    return result.model_dump(mode="json")
 
 @app.post("/tools/call/download_files_from_s3", operation_id="download_files_from_s3")
-def download_files_from_s3(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
+async def download_files_from_s3(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
     
     # Validate the payload against the RunArgs schema
     if "folder" in payload and "experiment_file" in payload and "files_names_list" in payload:
-        args = DownloadS3Args(**payload)                     # plain
+        args = _validate_args(S3_INPUT_ADAPTER, payload)             # plain
     elif "args" in payload:
-        args = DownloadS3Args(**payload["args"])             # wrapped
+        args = _validate_args(S3_INPUT_ADAPTER, payload["args"])     # wrapped
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Expected keys: folder & experiment_file & files_names_list"
         )
 
-    # Check if directory exists and create it if not
-    work_dir = (DATA_ROOT / args.folder).resolve()
-
-    # Don't allow path traversal outside DATA_ROOT
-    if DATA_ROOT not in work_dir.parents:
-        raise HTTPException(status_code=400, detail="Invalid folder (outside DATA_ROOT)")
+    # Resolve the folder under DATA_ROOT (no path traversal)
+    work_dir = _resolve_work_dir(args.folder)
 
     # Create the directory if it does not exist
     try:
@@ -253,19 +232,9 @@ def download_files_from_s3(payload: Dict[str, Any], token: str = Security(auth.v
             detail=f"Failed to create directory '{work_dir}': {e.strerror or e}"
         ) from e
 
-    # Change to the target directory
-    try:
-        os.chdir(work_dir)
-        print(f"Changed directory to {work_dir}")
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"{work_dir} not found")
-    except OSError as exc:
-        print(f"Error changing directory to {work_dir}: {exc}")
-        raise HTTPException(status_code=500, detail=str(exc))
-
     # Create an S3 client
     try:
-        s3 = boto3.client("s3", aws_access_key_id=ACCESS_KEY, aws_secret_access_key=SECRET_KEY)
+        s3 = _s3_client(None)
     except NoCredentialsError as e:
         raise RuntimeError("AWS credentials are missing or invalid.") from e
     except EndpointConnectionError as e:
@@ -273,19 +242,12 @@ def download_files_from_s3(payload: Dict[str, Any], token: str = Security(auth.v
     except (BotoCoreError, Exception) as e:
         raise RuntimeError(f"Failed to create S3 client: {e}") from e
     
-    # Download each file from the S3 bucket
-    errors = {}
-    for s3_file in args.files_names_list:
-        # Download each file from the S3 bucket
-        try:
-            s3.download_file(S3_BUCKET, s3_file, f"./{s3_file}")
-        except ClientError as e:
-            code = e.response.get("Error", {}).get("Code", "Unknown")
-            msg = e.response.get("Error", {}).get("Message", str(e))
-            errors[s3_file] = f"S3 ClientError [{code}]: {msg}"
-        except (BotoCoreError, Exception) as e:
-            errors[s3_file] = f"Unexpected error: {e}"
-    
+    # Map every file to its local target; names must not escape the folder
+    targets = {s3_file: _resolve_download_target(work_dir, s3_file) for s3_file in args.files_names_list}
+
+    # Download the files from the S3 bucket concurrently, off the event loop
+    errors = await asyncio.to_thread(_download_files_from_s3, s3, targets)
+
     # Check if any downloads failed
     if errors:
         # If using FastAPI, you could raise HTTPException(status_code=502, detail={"downloads_failed": errors})
@@ -296,27 +258,21 @@ def download_files_from_s3(payload: Dict[str, Any], token: str = Security(auth.v
     if not exp_file.is_file():
         raise HTTPException(status_code=400, detail="Experiment file not found")
 
-    # Create the result object
-    try:
-        result = DownloadS3ArgsResult(
-            exit_code=status.HTTP_200_OK,
-            folder_name=args.folder,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create result object: {e}"
-        )
+    # Create the result object (server-built values, no validation needed)
+    result = DownloadS3ArgsResult.model_construct(
+        exit_code=status.HTTP_200_OK,
+        folder_name=args.folder,
+    )
 
-    return json.loads(result.model_dump_json())
+    return result.model_dump(mode="json")
 
 @app.post("/tools/call/run_dssat_experiment", operation_id="run_dssat_experiment")
-def run_dssat_experiment(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
+async def run_dssat_experiment(payload: Dict[str, Any], token: str = Security(auth.verify)) -> Dict[str, Any]:
     # Validate the payload against the RunArgs schema
     if "folder" in payload and "experiment_file" in payload:
-        args = RunArgs(**payload)                     # plain
+        args = _validate_args(RUN_INPUT_ADAPTER, payload)             # plain
     elif "args" in payload:
-        args = RunArgs(**payload["args"])             # wrapped
+        args = _validate_args(RUN_INPUT_ADAPTER, payload["args"])     # wrapped
     else:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -324,48 +280,231 @@ def run_dssat_experiment(payload: Dict[str, Any], token: str = Security(auth.ver
         )
 
     # Check if path to directory is correct
-    work_dir = (DATA_ROOT / args.folder).resolve()
-    if not work_dir.is_dir() or DATA_ROOT not in work_dir.parents:
+    work_dir = _resolve_work_dir(args.folder)
+    if not work_dir.is_dir():
         raise HTTPException(status_code=400, detail="Invalid folder")
 
-    # Change to the target directory
-    try:
-        os.chdir(work_dir)
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"{work_dir} not found")
-    except OSError as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
-
     exp_file = work_dir / args.experiment_file
     if not exp_file.is_file():
         raise HTTPException(status_code=400, detail="Experiment file not found")
 
-    # Build DSSAT command: <exe> A <exp_file>
-    cmd = [str(DSSAT_EXE), "A", args.experiment_file]
+    # Run DSSAT command: <exe> A <exp_file>
+    proc = await asyncio.create_subprocess_exec(
+        _DSSAT_EXE_STR, "A", args.experiment_file,
+        cwd=work_dir,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=work_dir,
-            text=True,
-            capture_output=True,
+        # Drain both pipes but keep only their tails, instead of buffering the full output
+        stdout, stderr, _ = await asyncio.wait_for(
+            asyncio.gather(_read_tail(proc.stdout), _read_tail(proc.stderr), proc.wait()),
             timeout=600,
-            check=False,
         )
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
         raise HTTPException(status_code=504, detail="DSSAT run timed out")
 
-    result = RunResult(
+    result = RunResult.model_construct(
         exit_code=proc.returncode,
-        stdout=proc.stdout[-10000:],
-        stderr=proc.stderr[-10000:],
-        summary=_parse_summary(work_dir),
+        stdout=stdout.decode(errors="replace"),
+        stderr=stderr.decode(errors="replace"),
+        summary=await asyncio.to_thread(_parse_summary, work_dir),
     )
 
-    return json.loads(result.model_dump_json())
+    return result.model_dump(mode="json")
+
+# ---------------------------------------------------------------------------
+# Helper function for arguments
+# ---------------------------------------------------------------------------
+def _validate_args(adapter: TypeAdapter, data: Any):
+    """Validate tool arguments, turning errors into a 422 that tells the client which field was wrong."""
+    try:
+        return adapter.validate_python(data)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False),
+        ) from e
+
+# ---------------------------------------------------------------------------
+# Helper function for paths
+# ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=128)
+def _resolve_work_dir(folder: str) -> Path:
+    """Resolve `folder` under DATA_ROOT, rejecting anything that escapes it.
+
+    Only the path arithmetic is cached; existence is still checked per request
+    because folders are created and deleted by the tools themselves.
+    """
+    work_dir = (DATA_ROOT / folder).resolve()
+    if DATA_ROOT not in work_dir.parents:
+        raise HTTPException(status_code=400, detail="Invalid folder (outside DATA_ROOT)")
+    return work_dir
+
+def _resolve_download_target(work_dir: Path, s3_file: str) -> Path:
+    """Local path for `s3_file` inside `work_dir`; absolute names and `..` escapes are rejected."""
+    target = (work_dir / s3_file).resolve()
+    if work_dir not in target.parents:
+        raise HTTPException(status_code=400, detail=f"Invalid file name '{s3_file}' (outside folder)")
+    return target
+
+# ---------------------------------------------------------------------------
+# Helper functions for S3 transfers
+# ---------------------------------------------------------------------------
+_S3_DOWNLOAD_WORKERS = 16       # files downloaded in parallel per request
+_S3_DOWNLOAD_CONCURRENCY = 4    # boto3 multipart threads per file
+
+@functools.lru_cache(maxsize=4)
+def _s3_client(endpoint_url: Optional[str]):
+    """One S3 client per endpoint for the whole process; botocore clients are thread-safe
+    and keep their HTTPS connection pool between requests."""
+    return boto3.client("s3",
+                        aws_access_key_id=ACCESS_KEY,
+                        aws_secret_access_key=SECRET_KEY,
+                        region_name=S3_REGION,
+                        endpoint_url=endpoint_url,
+                        config=Config(signature_version='s3v4',
+                                      # enough for every concurrent multipart download thread
+                                      max_pool_connections=_S3_DOWNLOAD_WORKERS * _S3_DOWNLOAD_CONCURRENCY,
+                                      retries={"max_attempts": 3, "mode": "adaptive"}))
+
+_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True,
+)
+
+_S3_DOWNLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=_S3_DOWNLOAD_CONCURRENCY,
+    use_threads=True,
+)
+
+def _download_files_from_s3(s3, targets: Dict[str, Path]) -> Dict[str, str]:
+    """Download every S3 key to its local target in parallel and return an error message per failed file."""
+    errors: Dict[str, str] = {}
+    max_workers = min(_S3_DOWNLOAD_WORKERS, len(targets)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {
+            ex.submit(s3.download_file, S3_BUCKET, s3_file, str(target), Config=_S3_DOWNLOAD_CONFIG): s3_file
+            for s3_file, target in targets.items()
+        }
+        for future in as_completed(futures):
+            s3_file = futures[future]
+            try:
+                future.result()
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code", "Unknown")
+                msg = e.response.get("Error", {}).get("Message", str(e))
+                errors[s3_file] = f"S3 ClientError [{code}]: {msg}"
+            except (BotoCoreError, Exception) as e:
+                errors[s3_file] = f"Unexpected error: {e}"
+    return errors
+
+def _walk_files(root: str):
+    """Yield the paths of all regular files under `root`, using scandir's cached entry types."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+_ZIP_STORE_THRESHOLD = 8 * 1024 * 1024   # files above this size are not compressed
+
+class _ZipPipeReader:
+    """Read end of the ZIP pipe that fails the upload if the writer thread failed.
+
+    The writer closes its end of the pipe even on error, so a plain reader would see a
+    normal EOF and S3 would store a truncated (but valid-looking) archive.
+    """
+
+    def __init__(self, fp, writer: threading.Thread, zip_errors: List[BaseException]):
+        self._fp = fp
+        self._writer = writer
+        self._zip_errors = zip_errors
+        self.failed = False
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fp.read(size)
+        # A short read from a blocking pipe means EOF: wait for the writer and check it
+        if size is None or size < 0 or len(data) < size:
+            self._writer.join()
+            if self._zip_errors:
+                self.failed = True
+                raise self._zip_errors[0]
+        return data
+
+def _stream_zip_to_s3(s3, work_dir: Path, key: str) -> Optional[BaseException]:
+    """Zip `work_dir` into a pipe from a background thread while S3 reads the other end.
+
+    Upload errors are raised; an error while building the archive is returned instead,
+    so the caller can tell the two apart.
+    """
+    read_fd, write_fd = os.pipe()
+    zip_errors: List[BaseException] = []
+
+    def _writer() -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as fp, zipfile.ZipFile(
+                fp, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=1
+            ) as zf:
+                root = os.fspath(work_dir)
+                for path in _walk_files(root):
+                    zinfo = zipfile.ZipInfo.from_file(path, os.path.relpath(path, root))
+                    if zinfo.file_size > _ZIP_STORE_THRESHOLD:
+                        # Large inputs are stored as-is: DEFLATE CPU, not bandwidth, is the bottleneck
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                    else:
+                        # ZipFile.open() ignores the archive defaults, so set them on the entry
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                        zinfo._compresslevel = zf.compresslevel
+                    # Copy through the ZipInfo we already have, so each file is stat'd once
+                    with open(path, "rb") as src, zf.open(zinfo, "w") as dest:
+                        shutil.copyfileobj(src, dest, 1 << 20)
+        except BaseException as e:
+            zip_errors.append(e)
+
+    writer = threading.Thread(target=_writer, daemon=True)
+    writer.start()
+    read_fp = os.fdopen(read_fd, "rb")
+    reader = _ZipPipeReader(read_fp, writer, zip_errors)
+    try:
+        # Closing the read end on failure unblocks the writer with a broken pipe
+        with read_fp:
+            s3.upload_fileobj(reader, S3_BUCKET, key, Config=_S3_TRANSFER_CONFIG)
+    except Exception:
+        # The reader raised the writer's error to abort the upload; report it as a ZIP failure
+        if not reader.failed:
+            raise
+    finally:
+        writer.join()
+
+    return zip_errors[0] if zip_errors else None
 
 # ---------------------------------------------------------------------------
 # Helper function for output
 # ---------------------------------------------------------------------------
+async def _read_tail(stream: asyncio.StreamReader, limit: int = _OUTPUT_TAIL_BYTES) -> bytes:
+    """Read `stream` to EOF, keeping only its last `limit` bytes."""
+    tail = bytearray()
+    while chunk := await stream.read(64 * 1024):
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
+    return bytes(tail)
+
+# Fixed-width SUMMARY.OUT columns, built once instead of per line
+_SUMMARY_EXPT = slice(0, 8)
+_SUMMARY_PL_DATE = slice(19, 25)
+_SUMMARY_YIELD = slice(65, 72)
+# Title (*), comment (!) and header (@) lines never carry data
+_SUMMARY_SKIP_PREFIXES = ("*", "!", "@")
+
 def _parse_summary(work_dir: Path) -> Optional[Dict[str, Any]]:
     """Parse the standard SUMMARY.OUT (very naïvely) to extract key metrics."""
     summary_file = work_dir / "SUMMARY.OUT"
@@ -373,19 +512,21 @@ def _parse_summary(work_dir: Path) -> Optional[Dict[str, Any]]:
         return None
 
     kpis: List[Dict[str, Any]] = []
-    with summary_file.open() as fh:
-        for line in fh:
-            if line.startswith("@") or not line.strip():
-                continue
-            # DSSAT columns are fixed‑width; we pull a few common ones.
-            # Users can extend this parser as needed.
-            try:
-                exp_code = line[0:8].strip()
-                tdate = line[19:25].strip()   # planting date
-                yield_kg = float(line[65:72].strip())
-                kpis.append({"expt": exp_code, "pl_date": tdate, "yield_kg_ha": yield_kg})
-            except Exception:
-                pass
+    # Read the whole file in one call and split in C rather than iterating the file object
+    for line in summary_file.read_text().splitlines():
+        if not line or line.isspace() or line.startswith(_SUMMARY_SKIP_PREFIXES):
+            continue
+        # DSSAT columns are fixed‑width; we pull a few common ones.
+        # Users can extend this parser as needed.
+        try:
+            yield_kg = float(line[_SUMMARY_YIELD])   # float() ignores surrounding blanks
+        except ValueError:
+            continue
+        kpis.append({
+            "expt": line[_SUMMARY_EXPT].strip(),
+            "pl_date": line[_SUMMARY_PL_DATE].strip(),   # planting date
+            "yield_kg_ha": yield_kg,
+        })
 
     return {"n_treatments": len(kpis), "treatments": kpis}
 